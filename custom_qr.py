@@ -1,9 +1,10 @@
+import io
 import qrcode
 import PIL
 from PIL import Image, ImageDraw, ImageFont
 
 # Generate QR code
-qr = qrcode.QRCode(version=1, box_size=12, border=2)
+qr = qrcode.QRCode(box_size=12, border=2)
 qr.add_data('https://thepubcrawlcompany.com/be/brussels/producto/pubcrawls/')
 qr.make(fit=True)
 img = qr.make_image(fill_color=(0, 0, 0), back_color="white")
@@ -25,5 +26,10 @@ draw.text((10,105), "Buy Ticket for La Troupe Grand Place", font=font_small, fil
 
 draw.text((30,690), "Made with <3 by Thomas.", font=font, fill=(255,255,255))
 
-google_img.save('outputs/payment_qr.png')
+# Encode in memory and write the file in one go
+# optimize=False: skip the PNG encoder's multi-filter trials
+buf = io.BytesIO()
+google_img.save(buf, 'PNG', compress_level=1, optimize=False)
+with open('outputs/payment_qr.png', 'wb') as f:
+    f.write(buf.getbuffer())
 
@@ -1,3 +1,4 @@
+import io
 import qrcode
 import random
 from PIL import Image, ImageDraw, ImageFont
@@ -23,21 +24,33 @@ d.rectangle([0, img_size - img_size//4, img_size, img_size], fill=(52, 168, 83))
 qr = qrcode.QRCode()
 qr.add_data("https://maps.app.goo.gl/rWyqEFdX4WyLJmuT7?g_st=ic")
 qr.make(fit=True)
-qr_img = qr.make_image(fill_color=(66, 133, 244), back_color="white")
-# Scale and overlay QR code on image
-qr_size = 250
-qr_img = qr_img.resize((qr_size, qr_size))
+# Pick the box size so the QR code is rendered at its final size, no resize
+modules = qr.modules_count + 2 * qr.border
+qr.box_size = max(1, img_size // 2 // modules)
+qr_img = qr.make_image(fill_color=(66, 133, 244), back_color="white").get_image()
+# Overlay QR code on image
+qr_size = qr_img.size[0]
 pos = ((img_size - qr_size) // 2, (img_size - qr_size) // 2)
 img.paste(qr_img, pos)
 
 # Add google text
-draw = ImageDraw.Draw(img)
 font = ImageFont.truetype("fonts/CaviarDreams.ttf", 40)
-draw.text((10,10), "The PubCrawlCompany", font=font, fill=(255,255,255))
+d.text((10,10), "The PubCrawlCompany", font=font, fill=(255,255,255))
 
 font_review = ImageFont.truetype("fonts/ORGANICAL.ttf",50)
-draw.text((20,90), "Review", font=font_review, fill=(0,0,0))
-
-draw.text((60,390), "Thomas", font=font, fill=(255,255,255))
-
-img.save('multicolor_qr.png')
+d.text((20,90), "Review", font=font_review, fill=(0,0,0))
+
+d.text((60,390), "Thomas", font=font, fill=(255,255,255))
+
+# Only a handful of flat colours: a fixed palette shrinks what zlib has to encode
+palette = [255, 255, 255, 0, 0, 0, 66, 133, 244, 234, 67, 53, 251, 188, 5, 52, 168, 83]
+pal_img = Image.new('P', (1, 1))
+pal_img.putpalette(palette)
+img = img.quantize(palette=pal_img, dither=Image.Dither.NONE)
+
+# Encode in memory and write the file in one go
+# optimize=False: skip the PNG encoder's multi-filter trials
+buf = io.BytesIO()
+img.save(buf, 'PNG', compress_level=1, optimize=False)
+with open('multicolor_qr.png', 'wb') as f:
+    f.write(buf.getbuffer())